@@ -89,7 +89,30 @@ if jwt_secret == _default_jwt_secret:
 		)
 
 app.config["JWT_SECRET_KEY"] = jwt_secret
-app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=24)
+# Clients exchange the long-lived refresh token at `/refresh` for a new pair
+# (the old refresh token is spent). Set JWT_ACCESS_TOKEN_MINUTES=15 to make
+# access tokens short-lived. The default stays at 24 hours because the
+# committed `frontend/dist` bundle predates refresh support and would log
+# users out whenever its access token expires; lower it once a rebuilt
+# bundle is deployed.
+app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(
+	minutes=int(os.environ.get("JWT_ACCESS_TOKEN_MINUTES", 24 * 60))
+)
+app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(
+	days=int(os.environ.get("JWT_REFRESH_TOKEN_DAYS", 30))
+)
+# How often (in seconds) each worker pulls new revocations from the database.
+# Per-request revocation checks are served from memory, so this is the upper
+# bound on how long a token revoked by another worker keeps working.
+app.config["REVOCATION_SYNC_SECONDS"] = float(os.environ.get("REVOCATION_SYNC_SECONDS", 5))
+
+# Optionally serve the built frontend from this app (see spa.py). The
+# dist path defaults to `frontend/dist` at the repository root.
+app.config["SERVE_FRONTEND"] = os.environ.get("SERVE_FRONTEND", "false").lower() in ("1", "true", "yes")
+app.config["FRONTEND_DIST_DIR"] = os.environ.get(
+	"FRONTEND_DIST_DIR",
+	os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")),
+)
 
 # Initialize extensions
 db = SQLAlchemy(app)
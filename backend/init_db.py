@@ -9,7 +9,7 @@ This will call `db.create_all()` under the application context and
 create the SQLite file specified by `SQLALCHEMY_DATABASE_URI`.
 """
 from config import app, db
-from models import User, Task
+from models import User, Task, RevokedToken, SpentRefreshToken
 
 
 def init_db():
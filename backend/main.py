@@ -1,12 +1,24 @@
 from flask import request, jsonify
 from config import app, db, bcrypt, jwt
-from models import User, Task
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from models import User, Task, RevokedToken, SpentRefreshToken
+from revocation import RevocationCache
+from spa import register_frontend
+from flask_jwt_extended import (
+    create_access_token,
+    create_refresh_token,
+    jwt_required,
+    get_jwt,
+    get_jwt_identity,
+)
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 import os
+import uuid
 from flask import make_response
 import re
 
+revocations = RevocationCache(app.config["REVOCATION_SYNC_SECONDS"])
+
 # Validation helpers
 def validate_email(email):
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
@@ -25,16 +37,23 @@ def validate_password(password):
     return True
 
 
-@jwt.user_lookup_loader
-def user_lookup_callback(_jwt_header, jwt_data):
-    identity = jwt_data["sub"]
-    print(f"Looking up user with identity: {identity}")
-    user = User.query.get(identity)
-    if user is None:
-        print(f"User with identity {identity} not found in the database.")
-    else:
-        print(f"User with identity {identity} found: {user.username}")
-    return user
+def create_token_pair(user_id, session_id=None):
+    """Issue an access/refresh token pair tied to one login session.
+
+    Both tokens carry the same `sid` claim so logging out can revoke the
+    whole session with a single denylist entry.
+    """
+    claims = {"sid": session_id or str(uuid.uuid4())}
+    return {
+        "access_token": create_access_token(identity=str(user_id), additional_claims=claims),
+        "refresh_token": create_refresh_token(identity=str(user_id), additional_claims=claims),
+    }
+
+
+@jwt.token_in_blocklist_loader
+def check_if_token_revoked(_jwt_header, jwt_data):
+    # Served from the worker's in-memory denylist; no database I/O per request.
+    return revocations.is_revoked(jwt_data["jti"], jwt_data.get("sid"))
 
 
 # ============ AUTH ROUTES ============
@@ -82,12 +101,12 @@ def register():
         db.session.add(new_user)
         db.session.commit()
         
-        # Create access token
-        access_token = create_access_token(identity=str(new_user.id))
+        # Create access and refresh tokens
+        tokens = create_token_pair(new_user.id)
         
         return jsonify({
             "message": "User registered successfully",
-            "access_token": access_token,
+            **tokens,
             "user": new_user.to_json()
         }), 201
     except Exception as e:
@@ -110,16 +129,77 @@ def login():
     if not user or not bcrypt.check_password_hash(user.password_hash, password):
         return jsonify({"message": "Invalid username or password"}), 401
     
-    # Create access token
-    access_token = create_access_token(identity=str(user.id))
+    # Create access and refresh tokens
+    tokens = create_token_pair(user.id)
     
     return jsonify({
         "message": "Login successful",
-        "access_token": access_token,
+        **tokens,
         "user": user.to_json()
     }), 200
 
 
+@app.route("/refresh", methods=["POST"])
+@jwt_required(refresh=True)
+def refresh():
+    """Exchange a refresh token for a new access/refresh pair.
+
+    Refresh tokens are single-use: the presented one is recorded as spent
+    before the new pair is issued. Refreshing is infrequent, so unlike regular
+    requests this checks the database directly instead of trusting the
+    worker's cache (which never holds spent refresh tokens).
+    """
+    jwt_data = get_jwt()
+    jti = jwt_data["jti"]
+    session_id = jwt_data.get("sid")
+    user_id = get_jwt_identity()
+
+    if RevokedToken.query.filter(RevokedToken.jti.in_([jti, session_id or jti])).first():
+        return jsonify({"message": "Token has been revoked"}), 401
+
+    if SpentRefreshToken.query.filter_by(jti=jti).first():
+        return jsonify({"message": "Token has been revoked"}), 401
+
+    if not User.query.get(user_id):
+        return jsonify({"message": "User not found"}), 401
+
+    try:
+        revocations.spend_refresh_token(jti, datetime.utcfromtimestamp(jwt_data["exp"]))
+        db.session.commit()
+    except IntegrityError:
+        # Another request spent this refresh token first.
+        db.session.rollback()
+        return jsonify({"message": "Token has been revoked"}), 401
+
+    return jsonify(create_token_pair(user_id, session_id)), 200
+
+
+@app.route("/logout", methods=["POST"])
+@jwt_required(verify_type=False)
+def logout():
+    """Revoke the session of the presented (access or refresh) token."""
+    jwt_data = get_jwt()
+    session_id = jwt_data.get("sid")
+
+    if session_id:
+        # The session lives as long as its newest refresh token could.
+        expires_at = datetime.utcnow() + app.config["JWT_REFRESH_TOKEN_EXPIRES"]
+        revocation_id = session_id
+    else:
+        expires_at = datetime.utcfromtimestamp(jwt_data["exp"])
+        revocation_id = jwt_data["jti"]
+
+    try:
+        revocations.revoke(revocation_id, expires_at)
+        revocations.purge_expired()
+        db.session.commit()
+    except IntegrityError:
+        # Already revoked (e.g. logout sent twice).
+        db.session.rollback()
+
+    return jsonify({"message": "Logged out successfully"}), 200
+
+
 @app.route("/me", methods=["GET"])
 @jwt_required()
 def get_current_user():
@@ -324,6 +404,15 @@ def get_task_stats():
     }), 200
 
 
+# ============ FRONTEND ============
+
+# Registered after every API route: Werkzeug matches those before the
+# `<path:path>` catch-all, and register_frontend reads them to keep API paths
+# (e.g. `GET /refresh`, `GET /tasks/abc`) out of the SPA fallback.
+if app.config["SERVE_FRONTEND"]:
+    register_frontend(app, app.config["FRONTEND_DIST_DIR"])
+
+
 # ============ APP INITIALIZATION ============
 
 if __name__ == "__main__":
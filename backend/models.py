@@ -44,4 +44,31 @@ class Task(db.Model):
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
             "user_id": self.user_id
-        }
\ No newline at end of file
+        }
+
+
+class RevokedToken(db.Model):
+    """Denylist entry for a logged-out session.
+
+    `jti` holds the session id shared by every token issued from one login,
+    or a single token's id for tokens issued without a session id. Every
+    worker keeps these rows in memory, so only logout revocations go here;
+    spent refresh tokens live in `SpentRefreshToken`. Rows are only needed
+    until `expires_at`, after which the tokens would be rejected anyway.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False, index=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+class SpentRefreshToken(db.Model):
+    """A refresh token already exchanged at `/refresh` (they are single-use).
+
+    Only `/refresh` reads this table, straight from the database; these rows
+    are never loaded into the workers' in-memory denylist.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(36), unique=True, nullable=False, index=True)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
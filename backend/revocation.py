@@ -0,0 +1,91 @@
+"""In-memory revocation denylist shared by all requests in a worker.
+
+Every authenticated request has to know whether its session was logged out.
+Querying the database for that on each request is what we want to avoid, so
+each worker keeps a copy of the live rows of the `RevokedToken` table in
+memory and reloads it from the database at most once every
+`REVOCATION_SYNC_SECONDS`. Each sync reloads every unexpired row, which can't
+miss rows the way an id watermark can (SQLite reuses ids after deletes;
+concurrent transactions can commit out of id order).
+
+The set grows with logouts (one row per session, kept until the session's
+refresh token would have expired), not with request or refresh traffic.
+Spent refresh tokens are recorded in `SpentRefreshToken` instead: only
+`/refresh` needs them and it checks the database directly, so they are never
+loaded here.
+
+If a sync fails (missing table, database hiccup) the error is logged and the
+last good set keeps being served, so auth doesn't go down with the database.
+
+Revocations made by this worker are added to the local set immediately;
+revocations made by other workers become visible within one sync interval.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from config import db
+from models import RevokedToken, SpentRefreshToken
+
+logger = logging.getLogger("task_manager.backend.revocation")
+
+
+class RevocationCache:
+    def __init__(self, sync_interval):
+        self.sync_interval = sync_interval
+        self._entries = {}  # jti/session id -> expires_at (naive UTC)
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, *ids):
+        """Return True if any of the given token/session ids is revoked."""
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+        return any(i in self._entries for i in ids if i)
+
+    def sync(self):
+        """Replace the local set with all unexpired rows from the database."""
+        with self._lock:
+            now = datetime.utcnow()
+            # Retry after the normal interval whether or not this succeeds, so
+            # an outage doesn't turn into a query attempt on every request.
+            self._last_sync = time.monotonic()
+            try:
+                rows = (
+                    db.session.query(RevokedToken.jti, RevokedToken.expires_at)
+                    .filter(RevokedToken.expires_at > now)
+                    .all()
+                )
+            except SQLAlchemyError:
+                db.session.rollback()
+                logger.exception("Revocation sync failed; keeping the last synced denylist")
+                self._entries = {k: v for k, v in self._entries.items() if v > now}
+                return
+            self._entries = dict(rows)
+
+    def revoke(self, jti, expires_at):
+        """Persist a logout revocation and apply it to this worker right away.
+
+        The caller is responsible for committing the session.
+        """
+        db.session.add(RevokedToken(jti=jti, expires_at=expires_at))
+        with self._lock:
+            self._entries[jti] = expires_at
+
+    @staticmethod
+    def spend_refresh_token(jti, expires_at):
+        """Record a refresh token as used; database only, not cached.
+
+        The caller commits; a duplicate `jti` raises IntegrityError there.
+        """
+        db.session.add(SpentRefreshToken(jti=jti, expires_at=expires_at))
+
+    @staticmethod
+    def purge_expired():
+        """Delete revocation rows whose tokens have expired anyway."""
+        now = datetime.utcnow()
+        RevokedToken.query.filter(RevokedToken.expires_at <= now).delete()
+        SpentRefreshToken.query.filter(SpentRefreshToken.expires_at <= now).delete()
@@ -0,0 +1,111 @@
+"""Serve the built frontend (`frontend/dist`) from the Flask app.
+
+Enabled with SERVE_FRONTEND=true. Serving the SPA from the same origin as the
+API means the browser never sends CORS preflights for API calls (build the
+frontend with an empty VITE_API_URL so it uses relative URLs).
+
+- Files under `assets/` carry a content hash in their name, so they are sent
+  with a one-year `Cache-Control: immutable`.
+- Everything else (notably `index.html`) is sent with `no-cache` and an ETag,
+  so browsers revalidate it and get a cheap 304 when nothing changed.
+- If the client accepts it and the build produced a `.br` / `.gz` sibling
+  (see `frontend/scripts/compress.js`), that file is sent instead of
+  compressing on the fly.
+- Unknown paths without a file extension fall back to `index.html` so
+  client-side routes survive a page reload. Paths under an API route's first
+  segment (`/tasks/...`, `/refresh`, ...) never do: API clients get a JSON
+  404 instead of an HTML page.
+- The `.br` / `.gz` files themselves are not served directly; they are only
+  ever sent as an encoding of the file they sit next to.
+
+Files go through `send_from_directory`, which hands the open file to the
+server's `wsgi.file_wrapper`; under gunicorn that is delivered with
+`sendfile(2)` instead of being copied through Python.
+"""
+import mimetypes
+import os
+
+from flask import abort, jsonify, request, send_from_directory
+from werkzeug.security import safe_join
+
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+# Preferred first; matched against the request's Accept-Encoding.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+PRECOMPRESSED_SUFFIXES = tuple(suffix for _, suffix in PRECOMPRESSED_ENCODINGS)
+
+
+def _api_prefixes(app):
+    """First path segments of every route registered so far (e.g. `tasks`)."""
+    return {
+        rule.rule.lstrip("/").split("/", 1)[0]
+        for rule in app.url_map.iter_rules()
+        if rule.endpoint != "static"
+    } - {""}
+
+
+def _send_asset(dist_dir, path, immutable):
+    mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    encoding = None
+    filename = path
+
+    for candidate, suffix in PRECOMPRESSED_ENCODINGS:
+        if request.accept_encodings[candidate] <= 0:
+            continue
+        compressed = safe_join(dist_dir, path + suffix)
+        if compressed and os.path.isfile(compressed):
+            encoding, filename = candidate, path + suffix
+            break
+
+    response = send_from_directory(
+        dist_dir,
+        filename,
+        mimetype=mimetype,
+        max_age=IMMUTABLE_MAX_AGE if immutable else None,
+    )
+
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+
+    if immutable:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+
+    return response
+
+
+def register_frontend(app, dist_dir):
+    """Add routes serving `dist_dir` as a single-page app.
+
+    Call this after all API routes are registered so they are excluded from
+    the SPA fallback.
+    """
+    api_prefixes = _api_prefixes(app)
+    dist_dir = os.path.abspath(dist_dir)
+    if not os.path.isfile(os.path.join(dist_dir, "index.html")):
+        raise RuntimeError(
+            f"SERVE_FRONTEND is enabled but {dist_dir}/index.html does not exist. "
+            "Build the frontend first (npm --prefix frontend run build)."
+        )
+
+    @app.route("/", defaults={"path": ""}, methods=["GET"])
+    @app.route("/<path:path>", methods=["GET"])
+    def serve_frontend(path):
+        if path.split("/", 1)[0] in api_prefixes:
+            return jsonify({"message": "Not found"}), 404
+
+        if path.endswith(PRECOMPRESSED_SUFFIXES):
+            abort(404)
+
+        full_path = safe_join(dist_dir, path) if path else None
+        if full_path and os.path.isfile(full_path):
+            return _send_asset(dist_dir, path, immutable=path.startswith("assets/"))
+
+        # Missing files (e.g. a stale hashed asset) are a real 404; anything
+        # that looks like a page route gets the SPA shell.
+        if os.path.splitext(path)[1]:
+            abort(404)
+        return _send_asset(dist_dir, "index.html", immutable=False)
@@ -1,10 +1,15 @@
 """
 API Testing Script for Task Manager
 Run this after starting the Flask server to test all endpoints
+
+When the server runs with SERVE_FRONTEND=true, run this script with
+SERVE_FRONTEND=true as well to also test serving the built frontend.
 """
 
 import requests
 import json
+import os
+import re
 from datetime import datetime, timedelta
 
 BASE_URL = "http://127.0.0.1:5000"
@@ -39,6 +44,7 @@ def test_api():
     
     if response.status_code == 201:
         token = response.json().get("access_token")
+        refresh_token = response.json().get("refresh_token")
         print(f"✅ Registration successful! Token: {token[:20]}...")
     else:
         print("❌ Registration failed!")
@@ -52,6 +58,7 @@ def test_api():
         print_response("User Login (Fallback)", response)
         if response.status_code == 200:
             token = response.json().get("access_token")
+            refresh_token = response.json().get("refresh_token")
             print(f"✅ Login successful! Token: {token[:20]}...")
         else:
             print("❌ Both registration and login failed! Exiting...")
@@ -165,13 +172,93 @@ def test_api():
     response = requests.get(f"{BASE_URL}/tasks")
     print_response("Get Tasks Without Token (should fail)", response)
     
+    # Test 13: Refresh token rotation and logout
+    print("\n[BONUS] Testing Token Refresh and Logout...")
+    refresh_headers = {"Authorization": f"Bearer {refresh_token}"}
+    response = requests.post(f"{BASE_URL}/refresh", headers=refresh_headers)
+    print_response("Refresh Tokens", response)
+    if response.status_code == 200:
+        token = response.json().get("access_token")
+        headers = {"Authorization": f"Bearer {token}"}
+        new_refresh_headers = {"Authorization": f"Bearer {response.json().get('refresh_token')}"}
+
+        response = requests.post(f"{BASE_URL}/refresh", headers=refresh_headers)
+        print_response("Reuse Spent Refresh Token (should fail)", response)
+
+        response = requests.post(f"{BASE_URL}/logout", headers=headers)
+        print_response("Logout", response)
+
+        response = requests.post(f"{BASE_URL}/refresh", headers=new_refresh_headers)
+        print_response("Refresh After Logout (should fail)", response)
+    
     print("\n" + "✅ ALL TESTS COMPLETED! ".center(60, "="))
     print("\nCheck the results above to verify all endpoints are working correctly.")
     print(f"\nYour JWT Token (save for manual testing):\n{token}\n")
 
+def check(description, condition):
+    """Print a pass/fail line for a single expectation"""
+    print(f"{'✅' if condition else '❌'} {description}")
+    return condition
+
+
+def test_frontend():
+    """Test the built frontend served by the backend (SERVE_FRONTEND=true)"""
+    
+    print("\n" + "🌐 STARTING FRONTEND TESTS ".center(60, "="))
+    
+    # index.html and SPA fallback
+    print("\n[1/4] Testing index.html and SPA fallback...")
+    for path in ["/", "/some/client/route"]:
+        response = requests.get(f"{BASE_URL}{path}")
+        etag = response.headers.get("ETag")
+        check(f"GET {path} returns HTML", response.status_code == 200
+              and response.headers.get("Content-Type", "").startswith("text/html"))
+        check(f"GET {path} has an ETag", etag is not None)
+        check(f"GET {path} is revalidated (no-cache)", "no-cache" in response.headers.get("Cache-Control", ""))
+        if etag:
+            response = requests.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+            check(f"GET {path} with If-None-Match returns 304", response.status_code == 304)
+    
+    # Hashed assets
+    print("\n[2/4] Testing hashed assets...")
+    index_html = requests.get(f"{BASE_URL}/").text
+    asset_paths = re.findall(r'(?:src|href)="(/assets/[^"]+)"', index_html)
+    check("index.html references hashed assets", bool(asset_paths))
+    for path in asset_paths:
+        for encoding in ["br", "gzip"]:
+            # stream=True keeps requests from decoding the body, so the
+            # precompressed bytes and their headers are seen as sent.
+            response = requests.get(f"{BASE_URL}{path}", headers={"Accept-Encoding": encoding}, stream=True)
+            check(f"GET {path} ({encoding}) returns 200", response.status_code == 200)
+            check(f"GET {path} ({encoding}) is immutable", "immutable" in response.headers.get("Cache-Control", ""))
+            check(f"GET {path} ({encoding}) has Content-Encoding: {encoding}",
+                  response.headers.get("Content-Encoding") == encoding)
+            response.close()
+    
+    # Missing and precompressed files
+    print("\n[3/4] Testing missing assets...")
+    response = requests.get(f"{BASE_URL}/assets/index-missing.js")
+    check("Missing asset returns 404", response.status_code == 404)
+    if asset_paths:
+        response = requests.get(f"{BASE_URL}{asset_paths[0]}.gz")
+        check("Direct request for a .gz file returns 404", response.status_code == 404)
+    
+    # API paths must not fall back to the SPA
+    print("\n[4/4] Testing API paths are not served the SPA...")
+    for path in ["/refresh", "/tasks/abc"]:
+        response = requests.get(f"{BASE_URL}{path}")
+        check(f"GET {path} does not return HTML",
+              not response.headers.get("Content-Type", "").startswith("text/html"))
+        check(f"GET {path} returns 4xx", 400 <= response.status_code < 500)
+    
+    print("\n" + "✅ FRONTEND TESTS COMPLETED! ".center(60, "="))
+
+
 if __name__ == "__main__":
     try:
         test_api()
+        if os.environ.get("SERVE_FRONTEND", "false").lower() in ("1", "true", "yes"):
+            test_frontend()
     except requests.exceptions.ConnectionError:
         print("\n❌ ERROR: Could not connect to Flask server!")
         print("Make sure the Flask server is running on http://127.0.0.1:5000")
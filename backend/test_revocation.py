@@ -0,0 +1,118 @@
+"""
+Revocation cache checks for Task Manager
+Runs in-process against a throwaway SQLite database (no server needed):
+
+  python test_revocation.py
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+# Point the app at a temporary database before config.py reads DATABASE_URL.
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_db_dir, "revocation_test.db")
+
+from flask_jwt_extended import decode_token
+
+from config import app, db
+from main import revocations
+from models import RevokedToken, SpentRefreshToken
+from revocation import RevocationCache
+
+
+def test_revocation_survives_id_reuse():
+    """A revocation must reach a worker even if its row reuses a purged id.
+
+    SQLite hands out max(id) + 1, so deleting the newest row makes the next
+    insert reuse its id; an id watermark would skip that row forever.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        later = datetime.utcnow() + timedelta(hours=1)
+
+        # Another worker's revocations.
+        db.session.add(RevokedToken(jti="session-a", expires_at=later))
+        db.session.add(RevokedToken(jti="session-b", expires_at=later))
+        db.session.commit()
+
+        worker_a = RevocationCache(sync_interval=0)
+        assert worker_a.is_revoked("session-b")
+        old_id = RevokedToken.query.filter_by(jti="session-b").one().id
+
+        # session-b's tokens expire and a logout elsewhere purges its row...
+        RevokedToken.query.filter_by(jti="session-b").update(
+            {"expires_at": datetime.utcnow() - timedelta(seconds=1)}
+        )
+        RevocationCache.purge_expired()
+        # ...and the next logout's row takes over the freed id.
+        db.session.add(RevokedToken(jti="session-x", expires_at=later))
+        db.session.commit()
+        assert RevokedToken.query.filter_by(jti="session-x").one().id == old_id
+
+        assert worker_a.is_revoked("session-x")
+        assert worker_a.is_revoked("session-a")
+        assert not worker_a.is_revoked("session-b")
+
+
+def test_sync_failure_keeps_last_denylist():
+    """A database error during sync must not fail auth or forget revocations."""
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(RevokedToken(jti="session-a", expires_at=datetime.utcnow() + timedelta(hours=1)))
+        db.session.commit()
+
+        worker = RevocationCache(sync_interval=0)
+        assert worker.is_revoked("session-a")
+
+        RevokedToken.__table__.drop(db.engine)
+        assert worker.is_revoked("session-a")
+        assert not worker.is_revoked("session-z")
+
+
+def test_spent_refresh_token_stays_out_of_memory():
+    """A rotated refresh token is rejected by /refresh but never cached.
+
+    Spent refresh tokens pile up with refresh traffic; only /refresh needs
+    them, so the workers' in-memory denylist must not hold them.
+    """
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        client = app.test_client()
+
+        response = client.post("/register", json={
+            "username": "rotator",
+            "email": "rotator@example.com",
+            "password": "TestPass123",
+        })
+        assert response.status_code == 201
+        old_refresh = response.json["refresh_token"]
+        old_headers = {"Authorization": f"Bearer {old_refresh}"}
+        old_jti = decode_token(old_refresh)["jti"]
+
+        response = client.post("/refresh", headers=old_headers)
+        assert response.status_code == 200
+        new_headers = {"Authorization": f"Bearer {response.json['access_token']}"}
+
+        # Reusing the spent refresh token fails...
+        assert client.post("/refresh", headers=old_headers).status_code == 401
+        assert SpentRefreshToken.query.filter_by(jti=old_jti).count() == 1
+
+        # ...but it never enters the synced denylist, which stays empty
+        # until someone logs out.
+        revocations.sync()
+        assert old_jti not in revocations._entries
+        assert revocations._entries == {}
+        assert client.get("/me", headers=new_headers).status_code == 200
+
+
+if __name__ == "__main__":
+    test_revocation_survives_id_reuse()
+    print("✅ Revocation reaches workers after row id reuse")
+    test_sync_failure_keeps_last_denylist()
+    print("✅ Failed sync keeps serving the last denylist")
+    test_spent_refresh_token_stays_out_of_memory()
+    print("✅ Spent refresh tokens are rejected but not cached")
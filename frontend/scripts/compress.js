@@ -0,0 +1,36 @@
+// Write precompressed .br and .gz siblings next to the build output so the
+// backend can serve them directly (see backend/spa.py) instead of
+// compressing on every request. Runs after `vite build`.
+import { readdirSync, readFileSync, statSync, writeFileSync } from "node:fs";
+import { extname, join } from "node:path";
+import { fileURLToPath } from "node:url";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+const DIST_DIR = fileURLToPath(new URL("../dist/", import.meta.url));
+const COMPRESSIBLE = new Set([".html", ".js", ".css", ".svg", ".json", ".map", ".txt"]);
+// Below this size compression saves less than the extra header costs.
+const MIN_SIZE = 1024;
+
+const walk = (dir) =>
+  readdirSync(dir).flatMap((name) => {
+    const path = join(dir, name);
+    return statSync(path).isDirectory() ? walk(path) : [path];
+  });
+
+for (const file of walk(DIST_DIR)) {
+  if (!COMPRESSIBLE.has(extname(file))) continue;
+  const source = readFileSync(file);
+  if (source.length < MIN_SIZE) continue;
+
+  const brotli = brotliCompressSync(source, {
+    params: {
+      [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY,
+      [constants.BROTLI_PARAM_SIZE_HINT]: source.length,
+    },
+  });
+  const gzip = gzipSync(source, { level: constants.Z_BEST_COMPRESSION });
+
+  // Only keep variants that are actually smaller than the original.
+  if (brotli.length < source.length) writeFileSync(`${file}.br`, brotli);
+  if (gzip.length < source.length) writeFileSync(`${file}.gz`, gzip);
+}
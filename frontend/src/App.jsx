@@ -4,6 +4,7 @@ import AuthForm from "./AuthForm";
 import TaskList from "./TaskList";
 import TaskForm from "./TaskForm";
 import TaskStats from "./TaskStatus";
+import { API_BASE, authFetch, saveTokens, clearTokens } from "./api";
 
 function App() {
   const [token, setToken] = useState(localStorage.getItem("token"));
@@ -24,11 +25,7 @@ function App() {
 
   const fetchCurrentUser = async () => {
     try {
-      const response = await fetch("http://127.0.0.1:5000/me", {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+      const response = await authFetch(`${API_BASE}/me`);
       if (response.ok) {
         const data = await response.json();
         setUser(data.user);
@@ -43,16 +40,12 @@ function App() {
 
   const fetchTasks = async (filterParam = filter) => {
     try {
-      let url = "http://127.0.0.1:5000/tasks";
+      let url = `${API_BASE}/tasks`;
       if (filterParam !== "all") {
         url += `?completed=${filterParam === "completed"}`;
       }
       
-      const response = await fetch(url, {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+      const response = await authFetch(url);
       if (response.ok) {
         const data = await response.json();
         setTasks(data.tasks);
@@ -66,11 +59,7 @@ function App() {
 
   const fetchStats = async () => {
     try {
-      const response = await fetch("http://127.0.0.1:5000/tasks/stats", {
-        headers: {
-          Authorization: `Bearer ${token}`,
-        },
-      });
+      const response = await authFetch(`${API_BASE}/tasks/stats`);
       if (response.ok) {
         const data = await response.json();
         setStats(data);
@@ -82,14 +71,22 @@ function App() {
     }
   };
 
-  const handleLogin = (newToken, userData) => {
-    localStorage.setItem("token", newToken);
+  const handleLogin = (newToken, newRefreshToken, userData) => {
+    saveTokens(newToken, newRefreshToken);
     setToken(newToken);
     setUser(userData);
   };
 
   const handleLogout = () => {
-    localStorage.removeItem("token");
+    // Revoke the session server-side; the local logout doesn't wait for it.
+    const refreshToken = localStorage.getItem("refreshToken");
+    if (refreshToken) {
+      fetch(`${API_BASE}/logout`, {
+        method: "POST",
+        headers: { Authorization: `Bearer ${refreshToken}` },
+      }).catch(() => {});
+    }
+    clearTokens();
     setToken(null);
     setUser(null);
     setTasks([]);
@@ -172,7 +169,6 @@ function App() {
           tasks={tasks}
           updateTask={openEditModal}
           updateCallback={onUpdate}
-          token={token}
         />
 
         {isModalOpen && (
@@ -184,7 +180,6 @@ function App() {
               <TaskForm
                 existingTask={currentTask}
                 updateCallback={onUpdate}
-                token={token}
               />
             </div>
           </div>
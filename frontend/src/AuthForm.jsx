@@ -1,4 +1,5 @@
 import { useState } from "react";
+import { API_BASE } from "./api";
 
 const AuthForm = ({ onLogin }) => {
   const [isLogin, setIsLogin] = useState(true);
@@ -18,11 +19,8 @@ const AuthForm = ({ onLogin }) => {
       ? { username, password }
       : { username, email, password };
 
-    // Use Vite env var VITE_API_URL for deployed backend, fallback to localhost for dev
-    const API_BASE = import.meta.env.VITE_API_URL || "http://127.0.0.1:5000";
-
     try {
-      const response = await fetch(`${API_BASE.replace(/\/$/, '')}/${endpoint}`, {
+      const response = await fetch(`${API_BASE}/${endpoint}`, {
         method: "POST",
         headers: {
           "Content-Type": "application/json",
@@ -33,7 +31,7 @@ const AuthForm = ({ onLogin }) => {
       const result = await response.json();
 
       if (response.ok) {
-        onLogin(result.access_token, result.user);
+        onLogin(result.access_token, result.refresh_token, result.user);
       } else {
         setError(result.message || "Authentication failed");
       }
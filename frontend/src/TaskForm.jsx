@@ -1,6 +1,7 @@
 import { useState } from "react";
+import { API_BASE, authFetch } from "./api";
 
-const TaskForm = ({ existingTask = {}, updateCallback, token }) => {
+const TaskForm = ({ existingTask = {}, updateCallback }) => {
   const [title, setTitle] = useState(existingTask.title || "");
   const [description, setDescription] = useState(existingTask.description || "");
   const [priority, setPriority] = useState(existingTask.priority || "medium");
@@ -23,20 +24,19 @@ const TaskForm = ({ existingTask = {}, updateCallback, token }) => {
     };
 
     const url = updating
-      ? `http://127.0.0.1:5000/tasks/${existingTask.id}`
-      : "http://127.0.0.1:5000/tasks";
+      ? `${API_BASE}/tasks/${existingTask.id}`
+      : `${API_BASE}/tasks`;
 
     const options = {
       method: updating ? "PATCH" : "POST",
       headers: {
         "Content-Type": "application/json",
-        Authorization: `Bearer ${token}`,
       },
       body: JSON.stringify(data),
     };
 
     try {
-      const response = await fetch(url, options);
+      const response = await authFetch(url, options);
       const result = await response.json();
 
       if (response.ok) {
@@ -1,17 +1,15 @@
 import React from "react";
+import { API_BASE, authFetch } from "./api";
 
-const TaskList = ({ tasks, updateTask, updateCallback, token }) => {
+const TaskList = ({ tasks, updateTask, updateCallback }) => {
   const onDelete = async (id) => {
     if (!confirm("Are you sure you want to delete this task?")) return;
 
     try {
-      const response = await fetch(
-        `http://127.0.0.1:5000/tasks/${id}`,
+      const response = await authFetch(
+        `${API_BASE}/tasks/${id}`,
         {
           method: "DELETE",
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
         }
       );
       
@@ -27,13 +25,10 @@ const TaskList = ({ tasks, updateTask, updateCallback, token }) => {
 
   const onToggle = async (id) => {
     try {
-      const response = await fetch(
-        `http://127.0.0.1:5000/tasks/${id}/toggle`,
+      const response = await authFetch(
+        `${API_BASE}/tasks/${id}/toggle`,
         {
           method: "PATCH",
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
         }
       );
       
@@ -0,0 +1,60 @@
+// Use Vite env var VITE_API_URL for deployed backend, fallback to localhost for dev.
+// Set it to an empty string when the backend serves the frontend itself
+// (SERVE_FRONTEND=true) so API calls are same-origin and need no preflight.
+export const API_BASE = (import.meta.env.VITE_API_URL ?? "http://127.0.0.1:5000").replace(/\/$/, "");
+
+export const saveTokens = (accessToken, refreshToken) => {
+  localStorage.setItem("token", accessToken);
+  localStorage.setItem("refreshToken", refreshToken);
+};
+
+export const clearTokens = () => {
+  localStorage.removeItem("token");
+  localStorage.removeItem("refreshToken");
+};
+
+// Refresh tokens are single-use, so concurrent requests that all hit an
+// expired access token must share one /refresh call.
+let refreshPromise = null;
+
+const refreshTokens = () => {
+  if (!refreshPromise) {
+    refreshPromise = (async () => {
+      const refreshToken = localStorage.getItem("refreshToken");
+      if (!refreshToken) return false;
+      try {
+        const response = await fetch(`${API_BASE}/refresh`, {
+          method: "POST",
+          headers: { Authorization: `Bearer ${refreshToken}` },
+        });
+        if (!response.ok) return false;
+        const data = await response.json();
+        saveTokens(data.access_token, data.refresh_token);
+        return true;
+      } catch (error) {
+        return false;
+      }
+    })().finally(() => {
+      refreshPromise = null;
+    });
+  }
+  return refreshPromise;
+};
+
+// fetch() with the stored access token; on 401 refreshes once and retries.
+export const authFetch = async (url, options = {}) => {
+  const send = () =>
+    fetch(url, {
+      ...options,
+      headers: {
+        ...options.headers,
+        Authorization: `Bearer ${localStorage.getItem("token")}`,
+      },
+    });
+
+  const response = await send();
+  if (response.status !== 401 || !(await refreshTokens())) {
+    return response;
+  }
+  return send();
+};